@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import os
+from typing import AsyncIterable, AsyncIterator
+
 from chatkit.server import StreamingResult
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,18 +14,87 @@ from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from .server import StarterChatServer
 
+DEFAULT_ALLOWED_ORIGINS = "http://localhost:3000,http://127.0.0.1:3000"
+CORS_MAX_AGE_SECONDS = 60 * 60 * 24  # 1 day
+
+
+def allowed_origins() -> list[str]:
+    raw = os.getenv("CHATKIT_ALLOWED_ORIGINS") or DEFAULT_ALLOWED_ORIGINS
+    return [origin.strip() for origin in raw.split(",") if origin.strip()]
+
+
 app = FastAPI(title="ChatKit Starter API")
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=allowed_origins(),
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
+    max_age=CORS_MAX_AGE_SECONDS,
 )
 
 chatkit_server = StarterChatServer()
 
+# Keep proxies such as nginx from buffering or caching the event stream.
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+SSE_BATCH_MAX_FRAMES = 16
+
+
+async def coalesce_frames(
+    frames: AsyncIterable[bytes],
+    max_frames: int = SSE_BATCH_MAX_FRAMES,
+) -> AsyncIterator[bytes]:
+    """Merge SSE frames that queue up while the client is sending into one chunk.
+
+    Every chunk from StreamingResult is a complete SSE frame, so joining them
+    is safe. A frame is flushed as soon as nothing else is waiting behind it,
+    so batching never adds latency; it only kicks in when the model outpaces
+    the socket.
+    """
+    queue: asyncio.Queue[bytes | BaseException | None] = asyncio.Queue(
+        maxsize=max_frames * 4
+    )
+
+    async def produce() -> None:
+        outcome: BaseException | None = None
+        try:
+            async for frame in frames:
+                await queue.put(frame)
+        except BaseException as error:
+            # Only our own cancel below should end the producer silently; any
+            # other failure, CancelledError from a nested task included, is
+            # handed to the consumer so the response can't hang.
+            if asyncio.current_task().cancelling():
+                raise
+            outcome = error
+        await queue.put(outcome)
+
+    producer = asyncio.create_task(produce())
+    try:
+        finished = False
+        error: BaseException | None = None
+        while not finished:
+            item = await queue.get()
+            batch: list[bytes] = []
+            while True:
+                if item is None or isinstance(item, BaseException):
+                    finished = True
+                    error = item
+                    break
+                batch.append(item)
+                if len(batch) >= max_frames or queue.empty():
+                    break
+                item = queue.get_nowait()
+            if batch:
+                yield b"".join(batch)
+        if error is not None:
+            raise error
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
 
 @app.post("/chatkit")
 async def chatkit_endpoint(request: Request) -> Response:
@@ -29,7 +103,13 @@ async def chatkit_endpoint(request: Request) -> Response:
     result = await chatkit_server.process(payload, {"request": request})
 
     if isinstance(result, StreamingResult):
-        return StreamingResponse(result, media_type="text/event-stream")
+        # Keep the stream async end to end: Starlette iterates a sync iterator
+        # on the thread pool, one dispatch per frame.
+        return StreamingResponse(
+            coalesce_frames(result),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS,
+        )
     if hasattr(result, "json"):
         return Response(content=result.json, media_type="application/json")
     return JSONResponse(result)
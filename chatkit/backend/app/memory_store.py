@@ -5,7 +5,9 @@ A production app would implement this using a persistant database.
 
 from __future__ import annotations
 
+from bisect import insort
 from collections import defaultdict
+from itertools import islice
 
 from chatkit.store import NotFoundError, Store
 from chatkit.types import Attachment, Page, ThreadItem, ThreadMetadata
@@ -14,6 +16,7 @@ from chatkit.types import Attachment, Page, ThreadItem, ThreadMetadata
 class MemoryStore(Store[dict]):
     def __init__(self):
         self.threads: dict[str, ThreadMetadata] = {}
+        # Items are kept sorted by created_at so loads never need to re-sort.
         self.items: dict[str, list[ThreadItem]] = defaultdict(list)
 
     async def load_thread(self, thread_id: str, context: dict) -> ThreadMetadata:
@@ -41,7 +44,7 @@ class MemoryStore(Store[dict]):
         self, thread_id: str, after: str | None, limit: int, order: str, context: dict
     ) -> Page[ThreadItem]:
         items = self.items.get(thread_id, [])
-        return self._paginate(
+        return self._paginate_sorted(
             items,
             after,
             limit,
@@ -53,7 +56,7 @@ class MemoryStore(Store[dict]):
     async def add_thread_item(
         self, thread_id: str, item: ThreadItem, context: dict
     ) -> None:
-        self.items[thread_id].append(item)
+        insort(self.items[thread_id], item, key=lambda i: i.created_at)
 
     async def save_item(self, thread_id: str, item: ThreadItem, context: dict) -> None:
         items = self.items[thread_id]
@@ -61,7 +64,7 @@ class MemoryStore(Store[dict]):
             if existing.id == item.id:
                 items[idx] = item
                 return
-        items.append(item)
+        insort(items, item, key=lambda i: i.created_at)
 
     async def load_item(
         self, thread_id: str, item_id: str, context: dict
@@ -103,6 +106,46 @@ class MemoryStore(Store[dict]):
         next_after = cursor_key(data[-1]) if has_more and data else None
         return Page(data=data, has_more=has_more, after=next_after)
 
+    def _paginate_sorted(
+        self,
+        rows: list,
+        after: str | None,
+        limit: int,
+        order: str,
+        sort_key,
+        cursor_key,
+    ):
+        # Rows are already in ascending order, so walk them lazily and only
+        # materialize the requested page instead of copying the whole list.
+        def ordered():
+            return self._iter_desc(rows, sort_key) if order == "desc" else iter(rows)
+
+        remaining = ordered()
+        if after:
+            for row in remaining:
+                if cursor_key(row) == after:
+                    break
+            else:
+                remaining = ordered()
+        window = list(islice(remaining, limit + 1))
+        data = window[:limit]
+        has_more = len(window) > limit
+        next_after = cursor_key(data[-1]) if has_more and data else None
+        return Page(data=data, has_more=has_more, after=next_after)
+
+    @staticmethod
+    def _iter_desc(rows: list, sort_key):
+        # Newest first, but rows with equal keys keep insertion order, matching
+        # a stable sorted(..., reverse=True).
+        end = len(rows)
+        while end:
+            start = end - 1
+            key = sort_key(rows[start])
+            while start and sort_key(rows[start - 1]) == key:
+                start -= 1
+            yield from rows[start:end]
+            end = start
+
     # Attachments are not implemented in the quickstart store
 
     async def save_attachment(self, attachment: Attachment, context: dict) -> None:
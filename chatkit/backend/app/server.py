@@ -4,17 +4,24 @@ from __future__ import annotations
 
 from typing import Any, AsyncIterator
 
-from agents import Runner
+from agents import RunConfig, Runner
 from chatkit.agents import AgentContext, simple_to_agent_input, stream_agent_response
 from chatkit.server import ChatKitServer
-from chatkit.types import ThreadMetadata, ThreadStreamEvent, UserMessageItem
+from chatkit.types import (
+    ThreadItem,
+    ThreadMetadata,
+    ThreadStreamEvent,
+    UserMessageItem,
+)
 
 from .memory_store import MemoryStore
-from agents import Agent
+from agents import Agent, ModelSettings
 
 
 MAX_RECENT_ITEMS = 30
 MODEL = "gpt-4.1-mini"
+# Thread metadata key holding the cursor where the history window starts.
+HISTORY_WINDOW_START_KEY = "history_window_start"
 
 
 assistant_agent = Agent[AgentContext[dict[str, Any]]](
@@ -41,14 +48,7 @@ class StarterChatServer(ChatKitServer[dict[str, Any]]):
         item: UserMessageItem | None,
         context: dict[str, Any],
     ) -> AsyncIterator[ThreadStreamEvent]:
-        items_page = await self.store.load_thread_items(
-            thread.id,
-            after=None,
-            limit=MAX_RECENT_ITEMS,
-            order="desc",
-            context=context,
-        )
-        items = list(reversed(items_page.data))
+        items = await self._load_history_window(thread, context)
         agent_input = await simple_to_agent_input(items)
 
         agent_context = AgentContext(
@@ -57,11 +57,50 @@ class StarterChatServer(ChatKitServer[dict[str, Any]]):
             request_context=context,
         )
 
+        # Key OpenAI's prompt cache by thread: each thread's append-only history
+        # window is the prefix that repeats from turn to turn.
+        run_config = RunConfig(
+            model_settings=ModelSettings(extra_body={"prompt_cache_key": thread.id})
+        )
         result = Runner.run_streamed(
             assistant_agent,
             agent_input,
             context=agent_context,
+            run_config=run_config,
         )
 
         async for event in stream_agent_response(agent_context, result):
             yield event
+
+    async def _load_history_window(
+        self, thread: ThreadMetadata, context: dict[str, Any]
+    ) -> list[ThreadItem]:
+        """Return the thread history to send to the model, oldest first.
+
+        The window grows from MAX_RECENT_ITEMS up to twice that before jumping
+        forward, instead of sliding by one item per turn, so OpenAI's prompt
+        cache can reuse the shared prefix between turns.
+        """
+        window_start = thread.metadata.get(HISTORY_WINDOW_START_KEY)
+        items_page = await self.store.load_thread_items(
+            thread.id,
+            after=window_start,
+            limit=2 * MAX_RECENT_ITEMS,
+            order="asc",
+            context=context,
+        )
+        if not items_page.has_more:
+            return items_page.data
+
+        recent_page = await self.store.load_thread_items(
+            thread.id,
+            after=None,
+            limit=MAX_RECENT_ITEMS + 1,
+            order="desc",
+            context=context,
+        )
+        # Kept on the thread so it is saved and deleted along with it.
+        thread.metadata[HISTORY_WINDOW_START_KEY] = recent_page.data[-1].id
+        await self.store.save_thread(thread, context)
+        # Single reversed slice drops the window anchor without an extra copy.
+        return recent_page.data[MAX_RECENT_ITEMS - 1 :: -1]
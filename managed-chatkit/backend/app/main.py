@@ -5,7 +5,9 @@ from __future__ import annotations
 import json
 import os
 import uuid
-from typing import Any, Mapping
+from contextlib import asynccontextmanager
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, AsyncIterator, Mapping
 
 import httpx
 from fastapi import FastAPI, Request
@@ -15,15 +17,49 @@ from fastapi.responses import JSONResponse
 DEFAULT_CHATKIT_BASE = "https://api.openai.com"
 SESSION_COOKIE_NAME = "chatkit_session_id"
 SESSION_COOKIE_MAX_AGE_SECONDS = 60 * 60 * 24 * 30  # 30 days
+DEFAULT_ALLOWED_ORIGINS = "http://localhost:3000,http://127.0.0.1:3000"
+CORS_MAX_AGE_SECONDS = 60 * 60 * 24  # 1 day
 
-app = FastAPI(title="Managed ChatKit Session API")
+
+def allowed_origins() -> list[str]:
+    raw = os.getenv("CHATKIT_ALLOWED_ORIGINS") or DEFAULT_ALLOWED_ORIGINS
+    return [origin.strip() for origin in raw.split(",") if origin.strip()]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    api_key = os.getenv("OPENAI_API_KEY")
+    headers = {
+        "OpenAI-Beta": "chatkit_beta=v1",
+        "Content-Type": "application/json",
+    }
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    # One pooled client per event loop so repeat session requests reuse the
+    # upstream connection instead of paying a fresh TCP+TLS handshake. The
+    # client is shared by every end user, so its cookie jar rejects upstream
+    # Set-Cookie values rather than replaying them across users.
+    async with httpx.AsyncClient(
+        base_url=chatkit_api_base(),
+        headers=headers,
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+    ) as client:
+        app.state.http_client = client
+        app.state.has_api_key = bool(api_key)
+        yield
+
+
+app = FastAPI(title="Managed ChatKit Session API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=allowed_origins(),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
+    max_age=CORS_MAX_AGE_SECONDS,
 )
 
 
@@ -35,8 +71,7 @@ async def health() -> Mapping[str, str]:
 @app.post("/api/create-session")
 async def create_session(request: Request) -> JSONResponse:
     """Exchange a workflow id for a ChatKit client secret."""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
+    if not request.app.state.has_api_key:
         return respond({"error": "Missing OPENAI_API_KEY environment variable"}, 500)
 
     body = await read_json_body(request)
@@ -45,19 +80,13 @@ async def create_session(request: Request) -> JSONResponse:
         return respond({"error": "Missing workflow id"}, 400)
 
     user_id, cookie_value = resolve_user(request.cookies)
-    api_base = chatkit_api_base()
+    client: httpx.AsyncClient = request.app.state.http_client
 
     try:
-        async with httpx.AsyncClient(base_url=api_base, timeout=10.0) as client:
-            upstream = await client.post(
-                "/v1/chatkit/sessions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "OpenAI-Beta": "chatkit_beta=v1",
-                    "Content-Type": "application/json",
-                },
-                json={"workflow": {"id": workflow_id}, "user": user_id},
-            )
+        upstream = await client.post(
+            "/v1/chatkit/sessions",
+            json={"workflow": {"id": workflow_id}, "user": user_id},
+        )
     except httpx.RequestError as error:
         return respond(
             {"error": f"Failed to reach ChatKit API: {error}"},
@@ -146,7 +175,7 @@ def resolve_user(cookies: Mapping[str, str]) -> tuple[str, str | None]:
     existing = cookies.get(SESSION_COOKIE_NAME)
     if existing:
         return existing, None
-    user_id = str(uuid.uuid4())
+    user_id = uuid.uuid4().hex
     return user_id, user_id
 
 